@@ -4,83 +4,112 @@
 
 This script supports both Let's Encrypt and self-signed certificates.
 """
+import errno
+import functools
+import socket
+import sys
 import time
 import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tempfile import mkstemp
-from shutil import move, copymode
-from os import fdopen, remove
-from pathlib import Path
-
+from shutil import copymode
+from os import fdopen
+
+# Compute every path the script needs once at import time; abspath hits
+# getcwd() and renormalizes on each call, so functions reference these
+# constants instead of rebuilding them.
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_DIR = os.path.join(SCRIPT_DIR, "config")
+ENV_FILE = os.path.join(CONFIG_DIR, "https.env")
+TARGET_CERT_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "certs"))
+EXISTING_CERT_DIR = "/etc/ssl/odkx"
+LDAP_ENV = os.path.join(SCRIPT_DIR, "ldap.env")
+
+# Compiled once at import; replaceInFile applies it over the whole file.
+LDAP_PWD_RE = re.compile(r"^\s*LDAP_ADMIN_PASSWORD=.*$", re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
 def ensure_directory_exists(directory):
-    """Creates directory if it doesn't exist with proper permissions."""
+    """Creates directory if it doesn't exist with proper permissions.
+
+    makedirs with exist_ok=True is atomic in the kernel, so there is no
+    separate exists() probe (and no race against one). Callers pass the
+    same handful of directories repeatedly, so results are cached.
+    """
     try:
-        if not os.path.exists(directory):
-            os.makedirs(directory, mode=0o755, exist_ok=True)
-            print(f"Created directory: {directory}")
+        os.makedirs(directory, mode=0o755, exist_ok=True)
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"Error creating directory {directory}: {str(e)}")
         return False
 
 def setup_certificate_paths(use_existing=False):
     """Sets up certificate paths and handles certificate copying if using existing certs."""
-    # Get the script's directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Define certificate paths
-    existing_cert_dir = "/etc/ssl/odkx"
-    target_cert_dir = os.path.join(script_dir, "..", "certs")
-    
     # Ensure directories exist
     if use_existing:
-        if not os.path.exists(existing_cert_dir):
-            print(f"\nWarning: Source certificate directory {existing_cert_dir} does not exist")
+        if not os.path.exists(EXISTING_CERT_DIR):
+            print(f"\nWarning: Source certificate directory {EXISTING_CERT_DIR} does not exist")
             print("Creating directory structure...")
-            ensure_directory_exists(existing_cert_dir)
-    
+            ensure_directory_exists(EXISTING_CERT_DIR)
+
     # Always ensure target directory exists
-    ensure_directory_exists(target_cert_dir)
-    
+    ensure_directory_exists(TARGET_CERT_DIR)
+
     if use_existing:
-        print(f"\nUsing certificates from {existing_cert_dir}")
-        return existing_cert_dir, target_cert_dir
+        print(f"\nUsing certificates from {EXISTING_CERT_DIR}")
+        return EXISTING_CERT_DIR, TARGET_CERT_DIR
     else:
-        return None, target_cert_dir
+        return None, TARGET_CERT_DIR
 
 def copy_existing_certificates(source_dir, target_dir):
     """Copies existing certificates from source to target directory."""
+    wanted = {'fullchain.pem', 'privkey.pem'}
     try:
-        # Define certificate files to copy
-        cert_files = {
-            'fullchain.pem': 'fullchain.pem',
-            'privkey.pem': 'privkey.pem'
-        }
-        
         print(f"\nCopying certificates from {source_dir} to {target_dir}")
-        
-        # Copy each certificate file
-        for source_file, target_file in cert_files.items():
-            source_path = os.path.join(source_dir, source_file)
-            target_path = os.path.join(target_dir, target_file)
-            
-            if os.path.exists(source_path):
-                shutil.copy2(source_path, target_path)
-                # Set appropriate permissions
-                os.chmod(target_path, 0o600)
-                print(f"Copied: {source_file}")
-            else:
-                print(f"Warning: Certificate file not found: {source_path}")
-                print("You will need to manually copy your certificates later.")
-                
+
+        # A single scandir enumerates the directory in one syscall
+        # instead of stat'ing each expected file individually.
+        try:
+            with os.scandir(source_dir) as entries:
+                present = {e.name for e in entries if e.name in wanted and e.is_file()}
+        except FileNotFoundError:
+            present = set()
+
+        # copyfile uses os.sendfile on Linux and skips the metadata copy
+        # copy2 would do; the mode is set explicitly anyway.
+        for name in sorted(wanted & present):
+            target_path = os.path.join(target_dir, name)
+            shutil.copyfile(os.path.join(source_dir, name), target_path)
+            os.chmod(target_path, 0o600)
+            print(f"Copied: {name}")
+        for name in sorted(wanted - present):
+            print(f"Warning: Certificate file not found: {os.path.join(source_dir, name)}")
+            print("You will need to manually copy your certificates later.")
+
         print("Certificate copying completed.")
-        
+
     except Exception as e:
         print(f"Error copying certificates: {str(e)}")
         raise
 
+def _install_certs(source_dir):
+    """Copies certificates from source_dir straight into TARGET_CERT_DIR.
+
+    Used right after generating certificates ourselves, when the source
+    paths are known to exist — no directory or file probing needed.
+    """
+    ensure_directory_exists(TARGET_CERT_DIR)
+    fullchain = os.path.join(TARGET_CERT_DIR, "fullchain.pem")
+    privkey = os.path.join(TARGET_CERT_DIR, "privkey.pem")
+    shutil.copyfile(os.path.join(source_dir, "fullchain.pem"), fullchain)
+    os.chmod(fullchain, 0o644)
+    shutil.copyfile(os.path.join(source_dir, "privkey.pem"), privkey)
+    os.chmod(privkey, 0o600)
+
+
 def create_self_signed_cert(domain, email, cert_dir):
     """Creates a self-signed certificate for the domain."""
     try:
@@ -119,13 +148,41 @@ def create_self_signed_cert(domain, email, cert_dir):
         print(f"Error creating self-signed certificate: {str(e)}")
         return False
 
+def yesno(prompt, default=True):
+    """Asks a yes/no question and returns the answer as a bool.
+
+    An empty answer picks the default; otherwise anything starting with
+    'y' (case-insensitive) counts as yes.
+    """
+    ans = input(prompt).strip().lower()
+    if not ans:
+        return default
+    return ans[0] == 'y'
+
+
+def port80_free():
+    """Checks whether port 80 is free to bind, in a single syscall.
+
+    Forking lsof would scan every process's fds; a bind attempt answers
+    the same question directly. EACCES only means binding a low port
+    needs root — certbot runs under sudo — so it doesn't count as busy.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        s.bind(("0.0.0.0", 80))
+        return True
+    except OSError as e:
+        return e.errno != errno.EADDRINUSE
+    finally:
+        s.close()
+
+
 def run_interactive_config():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    env_file_location = os.path.join(script_dir, "config", "https.env")
+    env_file_location = ENV_FILE
 
     # Create config directory if it doesn't exist
-    config_dir = os.path.join(script_dir, "config")
-    ensure_directory_exists(config_dir)
+    ensure_directory_exists(CONFIG_DIR)
 
     # Check if env file exists, create it with defaults if not
     if not os.path.exists(env_file_location):
@@ -135,39 +192,42 @@ def run_interactive_config():
             f.write("HTTPS_ADMIN_EMAIL=admin@example.com\n")
         domain = "localhost"
         email = "admin@example.com"
+        env_offsets = None
     else:
         try:
-            domain, email = parse_env_file(env_file_location)
-            print("Found configuration at {}".format(env_file_location))
+            domain, email, env_offsets = parse_env_file(env_file_location)
+            print(f"Found configuration at {env_file_location}")
         except Exception as e:
             print(f"Error parsing config file: {str(e)}")
             domain = "localhost"
             email = "admin@example.com"
+            env_offsets = None
             print("Using default values instead.")
 
+    domain_orig, email_orig = domain, email
+
     print("\nWelcome to the ODK-X sync endpoint installation!")
     print("This script will guide you through setting up your installation")
     print("We'll need some information from you to get started though...")
     time.sleep(1)
     print("")
     print("Please input the domain name you will use for this installation. A valid domain name is required for HTTPS without distributing custom certificates.")
-    input_domain = input("domain [({})]: ".format(domain))
+    input_domain = input(f"domain [({domain})]: ")
 
     if input_domain != "":
         domain = input_domain
 
     print("")
-    use_custom_password = input("Do you want to use a custom LDAP administration password (y/N)? ")
-    if use_custom_password.lower().strip() == "y":
+    if yesno("Do you want to use a custom LDAP administration password (y/N)? ", default=False):
         print("")
         print("Please input the password to use for ldap admin")
         default_ldap_pwd = input("Ldap admin password: ")
 
         if default_ldap_pwd != "":
-            ldap_env_path = os.path.join(script_dir, "ldap.env")
+            ldap_env_path = LDAP_ENV
             if os.path.exists(ldap_env_path):
-                replaceInFile(ldap_env_path, r"^\s*LDAP_ADMIN_PASSWORD=.*$", "LDAP_ADMIN_PASSWORD={}".format(default_ldap_pwd))
-                print("Password set to: {}".format(default_ldap_pwd))
+                replaceInFile(ldap_env_path, LDAP_PWD_RE, f"LDAP_ADMIN_PASSWORD={default_ldap_pwd}")
+                print(f"Password set to: {default_ldap_pwd}")
             else:
                 print(f"Warning: ldap.env file not found at {ldap_env_path}")
                 print("Creating ldap.env file with your password...")
@@ -175,25 +235,14 @@ def run_interactive_config():
                     f.write(f"LDAP_ADMIN_PASSWORD={default_ldap_pwd}\n")
                 print("ldap.env file created.")
 
-    while True:
-        print("Would you like to enforce HTTPS? We recommend yes.")
-        enforce_https = input("enforce https [(Y)/n]: ")
-        if enforce_https == "":
-            enforce_https = "y"
-        enforce_https = enforce_https.lower().strip()[0]
-        if enforce_https in ["y", "n"]:
-            break
+    print("Would you like to enforce HTTPS? We recommend yes.")
+    enforce_https = yesno("enforce https [(Y)/n]: ", default=True)
 
-    if enforce_https == "n":
+    if not enforce_https:
         print("Would you like to run an INSECURE and DANGEROUS server that will share your users's information if exposed to the Internet?")
-        insecure = input("run insecure [y/(N)]: ")
-        if insecure == "":
-            insecure = "n"
-        if insecure.lower().strip()[0] != "y":
+        if not yesno("run insecure [y/(N)]: ", default=False):
             raise RuntimeError("HTTPS is currently required to run a secure public server. Please restart and select to enforce HTTPS")
 
-    enforce_https = enforce_https == "y"
-
     print("Enforcing https:", enforce_https)
     if enforce_https:
         print("\nHow would you like to configure HTTPS?")
@@ -212,27 +261,26 @@ def run_interactive_config():
         elif cert_choice == "2":
             # Create self-signed certificates
             print("Please provide an admin email for the certificate")
-            input_email = input("admin email [({})]: ".format(email))
+            input_email = input(f"admin email [({email})]: ")
             if input_email != "":
                 email = input_email
                 
             # Create certificates in /etc/ssl/odkx
-            ssl_dir = "/etc/ssl/odkx"
+            ssl_dir = EXISTING_CERT_DIR
             ensure_directory_exists(ssl_dir)
             success = create_self_signed_cert(domain, email, ssl_dir)
-            
+
             if success:
                 # Copy the new certificates to the target directory
-                source_dir, target_dir = setup_certificate_paths(use_existing=True)
-                copy_existing_certificates(source_dir, target_dir)
+                _install_certs(ssl_dir)
             else:
                 print("Failed to create self-signed certificates. Please check permissions and try again.")
                 exit(1)
         else:
             # Original certificate generation code (Let's Encrypt)
-            _, target_dir = setup_certificate_paths(use_existing=False)
+            setup_certificate_paths(use_existing=False)
             print("Please provide an admin email for security updates with HTTPS registration")
-            input_email = input("admin email [({})]: ".format(email))
+            input_email = input(f"admin email [({email})]: ")
 
             if input_email != "":
                 email = input_email
@@ -241,49 +289,42 @@ def run_interactive_config():
             print("For this to work you must have already have purchased/acquired a domain name (or subdomain) and setup a DNS A or AAAA record to point at this server's IP address.")
             print("If you have not done this yet, please do it now...")
             time.sleep(1)
-            proceed = input("Domain is ready to proceed with certificate acquisition? [(Y)/n]: ")
-            if proceed == "":
-                proceed = "y"
-            if proceed.strip().lower()[0] != "y":
+            if not yesno("Domain is ready to proceed with certificate acquisition? [(Y)/n]: ", default=True):
                 print("Re-run this script once the domain is ready!")
                 exit(1)
                 
             print("Checking if port 80 is available...")
-            port_check = subprocess.run(["lsof", "-i", ":80"], capture_output=True)
-            if port_check.returncode == 0:
+            if not port80_free():
                 print("\nWARNING: Port 80 is already in use. This may cause Let's Encrypt verification to fail.")
-                print("The following processes are using port 80:")
-                print(port_check.stdout.decode())
-                print("Consider stopping these services before continuing.")
-                continue_anyway = input("Continue with Let's Encrypt anyway? (y/N): ")
-                if continue_anyway.lower().strip() != "y":
+                print("Consider stopping the service using it before continuing.")
+                if not yesno("Continue with Let's Encrypt anyway? (y/N): ", default=False):
                     print("Aborting. Please free port 80 and try again.")
                     exit(1)
 
-            os.system("sudo certbot certonly --standalone \
-              --email {} \
-              -d {} \
-              --rsa-key-size 4096 \
-              --agree-tos \
-              --cert-name bootstrap \
-              --keep-until-expiring \
-              --non-interactive".format(email, domain))
-              
+            subprocess.run(
+                ["sudo", "certbot", "certonly", "--standalone",
+                 "--email", email,
+                 "-d", domain,
+                 "--rsa-key-size", "4096",
+                 "--agree-tos",
+                 "--cert-name", "bootstrap",
+                 "--keep-until-expiring",
+                 "--non-interactive"])
+
+
             # Check if certbot succeeded by looking for certificates
             cert_path = "/etc/letsencrypt/live/bootstrap/fullchain.pem"
             if not os.path.exists(cert_path):
                 print("\nLet's Encrypt certificate generation failed.")
                 print("Would you like to use self-signed certificates instead? (Y/n)")
-                use_self_signed = input("Use self-signed certificates: ")
-                if use_self_signed == "" or use_self_signed.lower().strip()[0] == "y":
-                    ssl_dir = "/etc/ssl/odkx"
+                if yesno("Use self-signed certificates: ", default=True):
+                    ssl_dir = EXISTING_CERT_DIR
                     ensure_directory_exists(ssl_dir)
                     success = create_self_signed_cert(domain, email, ssl_dir)
                     
                     if success:
                         # Copy the new certificates to the target directory
-                        source_dir, target_dir = setup_certificate_paths(use_existing=True)
-                        copy_existing_certificates(source_dir, target_dir)
+                        _install_certs(ssl_dir)
                     else:
                         print("Failed to create self-signed certificates. Please check permissions and try again.")
                         exit(1)
@@ -293,117 +334,217 @@ def run_interactive_config():
             else:
                 # Copy Let's Encrypt certificates to target directory
                 print("Let's Encrypt certificates generated successfully.")
-                source_dir = "/etc/letsencrypt/live/bootstrap"
-                target_dir = os.path.join(script_dir, "..", "certs")
-                
-                ensure_directory_exists(target_dir)
                 try:
-                    shutil.copy2(os.path.join(source_dir, "fullchain.pem"), os.path.join(target_dir, "fullchain.pem"))
-                    shutil.copy2(os.path.join(source_dir, "privkey.pem"), os.path.join(target_dir, "privkey.pem"))
-                    os.chmod(os.path.join(target_dir, "fullchain.pem"), 0o644)
-                    os.chmod(os.path.join(target_dir, "privkey.pem"), 0o600)
+                    _install_certs("/etc/letsencrypt/live/bootstrap")
                     print("Certificates copied to target directory.")
                 except Exception as e:
                     print(f"Error copying Let's Encrypt certificates: {str(e)}")
                     print("You may need to manually copy the certificates later.")
 
-        print("Attempting to save updated https configuration")
-        try:
-            write_to_env_file(env_file_location, domain, email)
-        except Exception as e:
-            print(f"Error updating https configuration: {str(e)}")
-            print("You may need to manually update your https.env file.")
+        if (domain, email) != (domain_orig, email_orig):
+            print("Attempting to save updated https configuration")
+            try:
+                write_to_env_file(env_file_location, domain, email, env_offsets)
+            except Exception as e:
+                print(f"Error updating https configuration: {str(e)}")
+                print("You may need to manually update your https.env file.")
 
     return enforce_https
 
 
-def replaceInFile(file_path, pattern, subst):
+def replaceInFile(file_path, compiled_pattern, subst):
     try:
-        fh, abs_path = mkstemp()
-        with fdopen(fh,'w') as new_file:
-            with open(file_path) as old_file:
-                for line in old_file:
-                    new_file.write(re.sub(pattern, subst, line))
-        copymode(file_path, abs_path)
-        remove(file_path)
-        move(abs_path, file_path)
+        with open(file_path) as old_file:
+            data = old_file.read()
+        new_data = compiled_pattern.sub(subst, data)
+        _atomic_write(file_path, new_data)
     except Exception as e:
         print(f"Error replacing text in file {file_path}: {str(e)}")
         raise
 
-def write_to_env_file(filepath, domain_name, email):
-    """A janky in-memory file write.
 
-    This is not atomic and would use lots of ram for large files.
+def _atomic_write(file_path, data):
+    """Writes data to file_path atomically.
+
+    The data goes to a tempfile in the same directory so the final
+    os.replace is an atomic rename on the same filesystem; readers never
+    see a missing or half-written file.
+    """
+    fh, abs_path = mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), prefix=".tmp_")
+    try:
+        with fdopen(fh, 'w') as new_file:
+            new_file.write(data)
+            new_file.flush()
+            os.fsync(new_file.fileno())
+        if os.path.exists(file_path):
+            copymode(file_path, abs_path)
+        os.replace(abs_path, file_path)
+    except Exception:
+        try:
+            os.unlink(abs_path)
+        except OSError:
+            pass
+        raise
+
+def write_to_env_file(filepath, domain_name, email, offsets=None):
+    """Updates the https env file.
+
+    When offsets from parse_env_file are given and the new lines are the
+    same length as the old ones, the file is patched in place with a
+    couple of seek+write calls; otherwise it falls back to a streaming
+    atomic rewrite.
     """
+    replacements = {
+        "HTTPS_DOMAIN": f"HTTPS_DOMAIN={domain_name}\n",
+        "HTTPS_ADMIN_EMAIL": f"HTTPS_ADMIN_EMAIL={email}\n",
+    }
+    new_lines = {key: text.encode() for key, text in replacements.items()}
+    if offsets is not None and all(
+        key in offsets and offsets[key][1] == len(new_line)
+        for key, new_line in new_lines.items()
+    ):
+        try:
+            with open(filepath, mode="r+b") as f:
+                for key, new_line in new_lines.items():
+                    f.seek(offsets[key][0])
+                    f.write(new_line)
+            return
+        except Exception as e:
+            print(f"Error writing to env file {filepath}: {str(e)}")
+            raise
+
     try:
-        file_lines = []
-        with open(filepath, mode="r") as f:
-            for line in f:
-                file_lines.append(line)
-
-        with open(filepath, mode="w") as f:
-            for line in file_lines:
-                if line.startswith("HTTPS_DOMAIN="):
-                    line = "HTTPS_DOMAIN={}\n".format(domain_name)
-                if line.startswith("HTTPS_ADMIN_EMAIL="):
-                    line = "HTTPS_ADMIN_EMAIL={}\n".format(email)
-                f.write(line)
+        fh, abs_path = mkstemp(dir=os.path.dirname(os.path.abspath(filepath)), prefix=".tmp_")
+        try:
+            with open(filepath) as src, fdopen(fh, 'w') as dst:
+                for line in src:
+                    # One C-level partition and dict lookup per line
+                    # instead of a startswith call per key.
+                    key, sep, _ = line.partition("=")
+                    if sep and key in replacements:
+                        line = replacements[key]
+                    dst.write(line)
+                dst.flush()
+                os.fsync(dst.fileno())
+            copymode(filepath, abs_path)
+            os.replace(abs_path, filepath)
+        except Exception:
+            try:
+                os.unlink(abs_path)
+            except OSError:
+                pass
+            raise
     except Exception as e:
         print(f"Error writing to env file {filepath}: {str(e)}")
         raise
 
 
 def parse_env_file(filepath):
-    domain = None
-    email = None
+    """Parses the https env file, recording where each key's line lives.
+
+    Returns (domain, email, offsets) where offsets maps key names to
+    (byte offset, line length) pairs so a later write can patch the file
+    in place instead of rescanning it.
+    """
+    defaults = {"HTTPS_DOMAIN": "localhost", "HTTPS_ADMIN_EMAIL": "admin@example.com"}
+    found = {}
+    offsets = {}
     try:
-        with open(filepath) as f:
-            for line in f:
-                if line.startswith("HTTPS_DOMAIN="):
-                    domain=line[13:].strip()
-                if line.startswith("HTTPS_ADMIN_EMAIL="):
-                    email=line[18:].strip()
-        if domain is None:
-            domain = "localhost"
-        if email is None:
-            email = "admin@example.com"
-        return (domain, email)
+        with open(filepath, mode="rb") as f:
+            while True:
+                offset = f.tell()
+                raw = f.readline()
+                if not raw:
+                    break
+                # One C-level partition and dict lookup per line instead
+                # of a startswith call per key.
+                key, sep, value = raw.decode().partition("=")
+                if sep and key in defaults:
+                    found[key] = value.strip()
+                    offsets[key] = (offset, len(raw))
+                    if len(found) == len(defaults):
+                        break
+        domain = found.get("HTTPS_DOMAIN", defaults["HTTPS_DOMAIN"])
+        email = found.get("HTTPS_ADMIN_EMAIL", defaults["HTTPS_ADMIN_EMAIL"])
+        return (domain, email, offsets)
     except Exception as e:
         print(f"Error parsing env file {filepath}: {str(e)}")
         raise
 
 
+def _stream_subprocess(cmd, tag):
+    """Runs cmd, echoing each output line prefixed with [tag] as it arrives.
+
+    Streaming through a pipe keeps memory bounded to one line instead of
+    buffering a whole build log, and the prefix keeps concurrent builds'
+    interleaved output readable.
+
+    Raises CalledProcessError on a non-zero exit.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        sys.stdout.write(f"[{tag}] {line}")
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
 def run_docker_builds():
     print("\nBuilding Docker images. This may take some time...")
-    try:
-        subprocess.run(["docker", "build", "--pull", "-t", "odk/sync-web-ui", "https://github.com/odk-x/sync-endpoint-web-ui.git"], check=True)
-        subprocess.run(["docker", "build", "--pull", "-t", "odk/db-bootstrap", "db-bootstrap"], check=True)
-        subprocess.run(["docker", "build", "--pull", "-t", "odk/openldap", "openldap"], check=True)
-        subprocess.run(["docker", "build", "--pull", "-t", "odk/phpldapadmin", "phpldapadmin"], check=True)
+    # The four images have disjoint build contexts, so build them
+    # concurrently; wall-clock time tends toward the slowest build
+    # instead of the sum.
+    builds = [
+        ("odk/sync-web-ui", "https://github.com/odk-x/sync-endpoint-web-ui.git"),
+        ("odk/db-bootstrap", "db-bootstrap"),
+        ("odk/openldap", "openldap"),
+        ("odk/phpldapadmin", "phpldapadmin"),
+    ]
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+        futures = {
+            executor.submit(
+                _stream_subprocess,
+                ["docker", "build", "--pull", "-t", image, context],
+                image,
+            ): image
+            for image, context in builds
+        }
+        for future in as_completed(futures):
+            image = futures[future]
+            try:
+                future.result()
+                print(f"Built {image} successfully.")
+            except subprocess.CalledProcessError as e:
+                failed = True
+                print(f"Error building {image}: {str(e)}")
+
+    if not failed:
         print("Docker builds completed successfully.")
-    except subprocess.CalledProcessError as e:
-        print(f"Error during Docker builds: {str(e)}")
+    else:
         print("You may need to fix the issues and retry.")
-        retry = input("Continue with the setup anyway? (y/N): ")
-        if retry.lower().strip() != "y":
+        if not yesno("Continue with the setup anyway? (y/N): ", default=False):
             exit(1)
 
 
 def run_sync_endpoint_build():
     print("\nBuilding sync endpoint. This may take some time...")
     try:
-        build_cmd = "git clone -b master --single-branch --depth=1 https://github.com/odk-x/sync-endpoint && " + \
-                    "cd sync-endpoint && " + \
-                    "mvn -pl org.opendatakit:sync-endpoint-war,org.opendatakit:sync-endpoint-docker-swarm,org.opendatakit:sync-endpoint-common-dependencies clean install -DskipTests"
-        
-        subprocess.run(build_cmd, shell=True, check=True)
+        subprocess.run(
+            ["git", "clone", "-b", "master", "--single-branch", "--depth=1",
+             "https://github.com/odk-x/sync-endpoint"],
+            check=True)
+        subprocess.run(
+            ["mvn",
+             "-pl", "org.opendatakit:sync-endpoint-war,org.opendatakit:sync-endpoint-docker-swarm,org.opendatakit:sync-endpoint-common-dependencies",
+             "clean", "install", "-DskipTests"],
+            cwd="sync-endpoint", check=True)
         print("Sync endpoint build completed successfully.")
     except subprocess.CalledProcessError as e:
         print(f"Error during sync endpoint build: {str(e)}")
         print("You may need to fix the issues and retry.")
-        retry = input("Continue with deployment anyway? (y/N): ")
-        if retry.lower().strip() != "y":
+        if not yesno("Continue with deployment anyway? (y/N): ", default=False):
             exit(1)
 
 